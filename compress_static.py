@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Pre-compress the files in static/ so the server can send them as-is.
+
+Writes a gzip (.gz) and, when the brotli package is installed, a brotli (.br)
+variant next to every file. Re-run after editing anything in static/.
+"""
+
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+def compress_file(path: str) -> None:
+    """Write the .gz and .br variants of a single file."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    print(f"✅ {path}.gz")
+
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+        print(f"✅ {path}.br")
+
+def main():
+    if brotli is None:
+        print("💡 brotli is not installed; only gzip variants will be written")
+    for root, _, files in os.walk(STATIC_DIR):
+        for name in files:
+            if not name.endswith(COMPRESSED_SUFFIXES):
+                compress_file(os.path.join(root, name))
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,169 @@
-from fastapi import FastAPI, Query
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Scope
+from anyio import to_thread
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from collections import OrderedDict
 from pydantic import BaseModel
-from typing import List, Optional, Any, Dict
-import random
+from dataclasses import dataclass, fields
+from typing import List, Optional, Any, Dict, Tuple, Union
 import string
-from datetime import datetime, date
+import sys
+from datetime import datetime, date, timedelta
 from decimal import Decimal
-import uuid
+from mimetypes import guess_type
 import json
 import time
+import asyncio
+import functools
+import hashlib
+import calendar
+import os
+import zlib
+import numpy as np
+import orjson
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types that orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(content: Any) -> bytes:
+    """Encode a whole payload to JSON bytes in a single orjson pass."""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+class FastJSONResponse(ORJSONResponse):
+    """ORJSONResponse with a fallback encoder for Decimal values."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+def make_etag(body: bytes) -> str:
+    """
+    Return a weak ETag for a serialized response body. It is weak because
+    GZipMiddleware may re-encode the body while keeping the same header.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def cached_json_response(request: Request, body: bytes, etag: str, max_age: int = 300) -> Response:
+    """
+    Serve pre-serialized JSON with ``ETag``/``Cache-Control`` headers, or an
+    empty 304 when the client's ``If-None-Match`` already names this body.
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison, so W/ prefixes are ignored
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves a pre-compressed ``.br``/``.gz`` sibling of the
+    requested file when the client accepts it (see compress_static.py).
+    """
+
+    encodings = (("br", ".br"), ("gzip", ".gz"))
+
+    def file_response(self, full_path: Union[str, "os.PathLike[str]"], stat_result: os.stat_result,
+                      scope: Scope, status_code: int = 200) -> Response:
+        full_path = os.fspath(full_path)
+        # The siblings are only meant to be served in place of their source
+        # file; requested directly they would go out as the source's type
+        # with no Content-Encoding.
+        if full_path.endswith(tuple(suffix for _, suffix in self.encodings)):
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+        media_type = guess_type(full_path)[0] or "text/plain"
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding, suffix in self.encodings:
+            if accepted.get(encoding, accepted.get("*", 0.0)) <= 0:
+                continue
+            try:
+                compressed_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            # Ignore variants that are older than the file they were built from
+            if compressed_stat.st_mtime < stat_result.st_mtime:
+                continue
+            full_path, stat_result = full_path + suffix, compressed_stat
+            headers["Content-Encoding"] = encoding
+            break
+
+        # FileResponse derives ETag/Last-Modified from the file actually sent,
+        # so each encoding has its own validator and is revalidated on its own.
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            method=scope["method"],
+            media_type=media_type,
+            headers=headers
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Page generation on a cache miss runs in the threadpool, so size it to
+    # the machine instead of AnyIO's fixed default of 40 tokens.
+    to_thread.current_default_thread_limiter().total_tokens = 2 * (os.cpu_count() or 1)
+    yield
 
 app = FastAPI(
     title="HTTP Data Serve API",
     description="API that serves JSON objects with various data types and pagination support",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
-# Data model for our JSON objects
-class DataObject(BaseModel):
+# Paginated JSON pages run to tens of KB and compress well. Small responses
+# are left alone, and the pre-compressed static files already carry a
+# Content-Encoding, which the middleware passes through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Data model for our JSON objects. Row types are slotted dataclasses rather
+# than Pydantic models: the data is trusted, orjson serializes dataclasses
+# natively, and FastAPI can still derive the OpenAPI schema from them.
+@dataclass(slots=True)
+class DataObject:
     id: int
     uuid: str
     name: str
@@ -36,7 +181,8 @@ class DataObject(BaseModel):
     description: Optional[str]
 
 # Data model for objects with different date formats
-class DataObjectWithDifferentDates(BaseModel):
+@dataclass(slots=True)
+class DataObjectWithDifferentDates:
     id: int
     uuid: str
     name: str
@@ -91,102 +237,376 @@ class PaginatedResponseWithDifferentDates(BaseModel):
     has_next: bool
     has_previous: bool
 
-def generate_random_string(length: int = 10) -> str:
-    """Generate a random string of specified length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
-
-def generate_random_email() -> str:
-    """Generate a random email address."""
-    domains = ["gmail.com", "yahoo.com", "hotmail.com", "example.com", "test.org"]
-    username = generate_random_string(8).lower()
-    domain = random.choice(domains)
-    return f"{username}@{domain}"
-
-def generate_random_tags() -> List[str]:
-    """Generate random tags."""
-    all_tags = ["python", "javascript", "api", "web", "mobile", "data", "ai", "ml", 
-                "backend", "frontend", "database", "cloud", "devops", "security"]
-    num_tags = random.randint(1, 5)
-    return random.sample(all_tags, num_tags)
-
-def generate_random_metadata() -> Dict[str, Any]:
-    """Generate random metadata object."""
+def generate_uuids(rng: np.random.Generator, count: int) -> List[str]:
+    """Generate `count` version-4 UUID strings from a single draw of random bytes."""
+    raw = np.frombuffer(rng.bytes(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hexed = raw.tobytes().hex()
+    return [
+        f"{hexed[i:i + 8]}-{hexed[i + 8:i + 12]}-{hexed[i + 12:i + 16]}-{hexed[i + 16:i + 20]}-{hexed[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+# Memoized ISO strings for birth dates. The generators only produce about
+# 66 * 12 * 28 distinct (year, month, day) tuples, so the cache stays small.
+_ISO_DATE_CACHE: Dict[tuple, str] = {}
+
+def _iso_date(year: int, month: int, day: int) -> str:
+    """Return the ISO representation of a date, memoized per (y, m, d)."""
+    key = (year, month, day)
+    iso = _ISO_DATE_CACHE.get(key)
+    if iso is None:
+        iso = _ISO_DATE_CACHE[key] = date(year, month, day).isoformat()
+    return iso
+
+# Name tables for the long/readable formats, so no format goes through
+# strftime and the locale machinery. Same spelling as the C locale.
+MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December")
+MONTH_ABBRS = tuple(month[:3] for month in MONTHS)
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Time-of-day suffixes indexed by hour * 60 + minute, so datetime formats
+# only pay for the (memoized) date part
+_CLOCK_ISO = tuple(f"T{hour:02d}:{minute:02d}:00" for hour in range(24) for minute in range(60))
+_CLOCK_12H = tuple(
+    f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+    for hour in range(24) for minute in range(60)
+)
+
+# Zero-padded day/month strings. Indexing a table is several times cheaper
+# than a ":02d" format spec, so the date formats need no memoization; the
+# generators only draw four-digit years, so those are formatted as-is.
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+def _fmt_us(year: int, month: int, day: int) -> str:
+    """US date format: 12/25/2023."""
+    return f"{_TWO_DIGITS[month]}/{_TWO_DIGITS[day]}/{year}"
+
+def _fmt_eu(year: int, month: int, day: int) -> str:
+    """EU date format: 25/12/2023."""
+    return f"{_TWO_DIGITS[day]}/{_TWO_DIGITS[month]}/{year}"
+
+def _fmt_long(year: int, month: int, day: int) -> str:
+    """Long date format: December 25, 2023."""
+    return f"{MONTHS[month - 1]} {_TWO_DIGITS[day]}, {year}"
+
+# Memoized because the weekday needs a date() object per call; created dates
+# span five years of days 1-28, i.e. under 2,000 distinct values.
+@functools.lru_cache(maxsize=4096)
+def _fmt_readable_date(year: int, month: int, day: int) -> str:
+    """Date part of the readable format: Mon, Dec 25 2023."""
+    return f"{WEEKDAYS[date(year, month, day).weekday()]}, {MONTH_ABBRS[month - 1]} {_TWO_DIGITS[day]} {year}"
+
+def _fmt_iso_datetime(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """ISO datetime format: 2023-12-25T10:30:00."""
+    return _iso_date(year, month, day) + _CLOCK_ISO[hour * 60 + minute]
+
+def _fmt_readable(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """Readable datetime format: Mon, Dec 25 2023 10:30 AM."""
+    return f"{_fmt_readable_date(year, month, day)} {_CLOCK_12H[hour * 60 + minute]}"
+
+_ALPHANUMERIC = np.array(list(string.ascii_letters + string.digits))
+_LOWER_ALPHANUMERIC = np.array(list(string.ascii_lowercase + string.digits))
+
+def generate_random_strings(rng: np.random.Generator, count: int, length: int,
+                            alphabet: np.ndarray = _ALPHANUMERIC) -> List[str]:
+    """Generate ``count`` random strings of ``length`` characters in one draw."""
+    chars = alphabet[rng.integers(0, len(alphabet), size=(count, length))]
+    # Each row of single characters is reinterpreted as one fixed-width string
+    return chars.view(f"<U{length}").ravel().tolist()
+
+def _interned(*values: str) -> Tuple[str, ...]:
+    """Build an immutable pool of interned strings."""
+    return tuple(sys.intern(value) for value in values)
+
+# Value pools shared by the batched generators. Every generated row points at
+# these same string objects instead of holding its own copies.
+DOMAINS = _interned("gmail.com", "yahoo.com", "hotmail.com", "example.com", "test.org")
+ALL_TAGS = _interned("python", "javascript", "api", "web", "mobile", "data", "ai", "ml",
+                     "backend", "frontend", "database", "cloud", "devops", "security")
+DEPARTMENTS = _interned("Engineering", "Marketing", "Sales", "HR", "Finance")
+LOCATIONS = _interned("New York", "San Francisco", "London", "Tokyo", "Berlin")
+SKILLS = _interned("Python", "Java", "React", "Node.js", "SQL", "Docker")
+
+def _sample_indices(rng: np.random.Generator, count: int, population: int,
+                    min_size: int, max_size: int) -> List[List[int]]:
+    """Draw, per row, between min_size and max_size distinct indices into a pool."""
+    # argsort of a random matrix gives an independent permutation per row
+    order = rng.random((count, population)).argsort(axis=1).tolist()
+    sizes = rng.integers(min_size, max_size + 1, size=count).tolist()
+    return [row[:size] for row, size in zip(order, sizes)]
+
+def gen_numeric_page(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, ...]:
+    """
+    Generate the numeric columns for a page in one pass.
+
+    Returns ``(ages, heights, weights, balances, scores, score_mask)`` as NumPy
+    arrays; the callers only convert them to Python values when building rows.
+    The two-decimal fields are drawn as int32 hundredths (fixed point), so
+    every value is an exact number of cents with no rounding step, and are
+    scaled back to floats once per column.
+    """
+    ages = rng.integers(18, 81, size=count, dtype=np.int32)
+    heights = rng.integers(15000, 20001, size=count, dtype=np.int32) / 100
+    weights = rng.integers(4500, 12001, size=count, dtype=np.int32) / 100
+    balances = rng.integers(0, 10000001, size=count, dtype=np.int32) / 100
+    scores = rng.integers(0, 10001, size=count, dtype=np.int32) / 100
+    score_mask = rng.integers(0, 2, size=count) == 1
+    return ages, heights, weights, balances, scores, score_mask
+
+def _generate_common_columns(rng: np.random.Generator, start_id: int, count: int,
+                             now_iso: str) -> Dict[str, Union[list, np.ndarray]]:
+    """
+    Generate the columns shared by both data endpoints for one page.
+
+    Each column is produced as a whole (structure of arrays). Plain numeric
+    columns stay NumPy arrays until _assemble_rows() unboxes them; columns
+    that need per-value Python work (strings, nullable values) are lists.
+    Birth dates are returned as separate year/month/day columns so each
+    endpoint can format them its own way.
+    """
+    ids = np.arange(start_id, start_id + count)
+    ages, heights, weights, balances, scores, has_score = gen_numeric_page(rng, count)
+    has_description = (rng.integers(0, 2, size=count) == 1).tolist()
+    tag_indices = _sample_indices(rng, count, len(ALL_TAGS), 1, 5)
+    skill_indices = _sample_indices(rng, count, len(SKILLS), 2, 4)
+
     return {
-        "department": random.choice(["Engineering", "Marketing", "Sales", "HR", "Finance"]),
-        "location": random.choice(["New York", "San Francisco", "London", "Tokyo", "Berlin"]),
-        "experience_years": random.randint(1, 20),
-        "skills": random.sample(["Python", "Java", "React", "Node.js", "SQL", "Docker"], 
-                               random.randint(2, 4)),
-        "certification": random.choice([True, False]),
-        "last_login": datetime.now().isoformat()
+        "id": ids,
+        "uuid": generate_uuids(rng, count),
+        "name": [f"User {name}" for name in generate_random_strings(rng, count, 6)],
+        "email": [
+            f"{username}@{DOMAINS[d]}"
+            for username, d in zip(
+                generate_random_strings(rng, count, 8, _LOWER_ALPHANUMERIC),
+                rng.integers(0, len(DOMAINS), size=count).tolist()
+            )
+        ],
+        "age": ages,
+        "height": heights,
+        "weight": weights,
+        "is_active": rng.integers(0, 2, size=count) == 1,
+        "balance": balances,
+        "birth_year": rng.integers(1940, 2006, size=count).tolist(),
+        "birth_month": rng.integers(1, 13, size=count).tolist(),
+        "birth_day": rng.integers(1, 29, size=count).tolist(),
+        "tags": [[ALL_TAGS[t] for t in tags] for tags in tag_indices],
+        "metadata": [
+            {
+                "department": DEPARTMENTS[department],
+                "location": LOCATIONS[location],
+                "experience_years": experience,
+                "skills": [SKILLS[s] for s in skills],
+                "certification": certified,
+                "last_login": now_iso
+            }
+            for department, location, experience, skills, certified in zip(
+                rng.integers(0, len(DEPARTMENTS), size=count).tolist(),
+                rng.integers(0, len(LOCATIONS), size=count).tolist(),
+                rng.integers(1, 21, size=count).tolist(),
+                skill_indices,
+                (rng.integers(0, 2, size=count) == 1).tolist()
+            )
+        ],
+        "score": [score if keep else None for score, keep in zip(scores.tolist(), has_score.tolist())],
+        "description": [
+            f"This is a sample description for user {id}" if keep else None
+            for id, keep in zip(ids.tolist(), has_description)
+        ]
     }
 
-def generate_data_object(id: int) -> DataObject:
-    """Generate a single data object with all data types."""
-    return DataObject(
-        id=id,
-        uuid=str(uuid.uuid4()),
-        name=f"User {generate_random_string(6)}",
-        email=generate_random_email(),
-        age=random.randint(18, 80),
-        height=round(random.uniform(150.0, 200.0), 2),
-        weight=round(random.uniform(45.0, 120.0), 2),
-        is_active=random.choice([True, False]),
-        balance=round(random.uniform(0.0, 100000.0), 2),
-        birth_date=date(
-            random.randint(1940, 2005),
-            random.randint(1, 12),
-            random.randint(1, 28)
-        ).isoformat(),
-        created_at=datetime.now().isoformat(),
-        tags=generate_random_tags(),
-        metadata=generate_random_metadata(),
-        score=round(random.uniform(0.0, 100.0), 2) if random.choice([True, False]) else None,
-        description=f"This is a sample description for user {id}" if random.choice([True, False]) else None
-    )
+# Row keys, in the same order as the documented models
+DATA_OBJECT_FIELDS = tuple(field.name for field in fields(DataObject))
+DATA_OBJECT_WITH_DATES_FIELDS = tuple(field.name for field in fields(DataObjectWithDifferentDates))
 
-def generate_data_object_with_different_dates(id: int) -> DataObjectWithDifferentDates:
-    """Generate a single data object with different date formats."""
-    # Generate random birth date
-    birth_date_obj = date(
-        random.randint(1940, 2005),
-        random.randint(1, 12),
-        random.randint(1, 28)
-    )
+def _assemble_rows(fields: Tuple[str, ...],
+                   columns: Dict[str, Union[list, np.ndarray]]) -> List[Dict[str, Any]]:
+    """Zip a page's columns into row dicts with keys in ``fields`` order."""
+    # Unbox each NumPy column in one C-level tolist() call. Leaving NumPy
+    # scalars in the rows (serialized via OPT_SERIALIZE_NUMPY) measured ~25%
+    # slower, since every element would become a boxed NumPy scalar instead.
+    values = [
+        column.tolist() if isinstance(column, np.ndarray) else column
+        for column in (columns[field] for field in fields)
+    ]
+    return [dict(zip(fields, row)) for row in zip(*values)]
+
+def generate_data_objects(start_id: int, count: int, now_iso: Optional[str] = None,
+                          seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Generate ``count`` data objects with consecutive ids starting at ``start_id``.
+
+    Every random draw for the page is made up front, column by column, so no
+    RNG work happens while rows are assembled. Rows are plain dicts shaped
+    like DataObject and are serialized directly by orjson.
+    Passing ``seed`` makes the page reproducible.
+    """
+    now_iso = now_iso or datetime.now().isoformat()
+    rng = np.random.default_rng(seed)
+
+    columns = _generate_common_columns(rng, start_id, count, now_iso)
+    columns["birth_date"] = [
+        _iso_date(*ymd)
+        for ymd in zip(columns["birth_year"], columns["birth_month"], columns["birth_day"])
+    ]
+    columns["created_at"] = [now_iso] * count
+    return _assemble_rows(DATA_OBJECT_FIELDS, columns)
+
+def generate_data_objects_with_different_dates(start_id: int, count: int, now_iso: Optional[str] = None,
+                                               seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Generate ``count`` data objects with different date formats.
+
+    Uses the same column generation as generate_data_objects(); rows are
+    plain dicts shaped like DataObjectWithDifferentDates.
+    """
+    now_iso = now_iso or datetime.now().isoformat()
+    rng = np.random.default_rng(seed)
+
+    columns = _generate_common_columns(rng, start_id, count, now_iso)
+    birth_dates = list(zip(columns["birth_year"], columns["birth_month"], columns["birth_day"]))
+    created = list(zip(
+        rng.integers(2020, 2025, size=count).tolist(),
+        rng.integers(1, 13, size=count).tolist(),
+        rng.integers(1, 29, size=count).tolist(),
+        rng.integers(0, 24, size=count).tolist(),
+        rng.integers(0, 60, size=count).tolist()
+    ))
+
+    # Different birth date formats
+    columns["birth_date_iso"] = [_iso_date(*ymd) for ymd in birth_dates]  # 2023-12-25
+    columns["birth_date_us"] = [_fmt_us(*ymd) for ymd in birth_dates]  # 12/25/2023
+    columns["birth_date_eu"] = [_fmt_eu(*ymd) for ymd in birth_dates]  # 25/12/2023
+    columns["birth_date_long"] = [_fmt_long(*ymd) for ymd in birth_dates]  # December 25, 2023
+    # Different created_at formats
+    columns["created_at_iso"] = [_fmt_iso_datetime(*dt) for dt in created]  # 2023-12-25T10:30:00
+    columns["created_at_timestamp"] = [calendar.timegm(dt + (0,)) for dt in created]  # Unix timestamp (UTC)
+    columns["created_at_readable"] = [_fmt_readable(*dt) for dt in created]  # Mon, Dec 25 2023 10:30 AM
+    return _assemble_rows(DATA_OBJECT_WITH_DATES_FIELDS, columns)
+
+_PAGE_GENERATORS = {
+    "data": generate_data_objects,
+    "data-with-date-formats": generate_data_objects_with_different_dates,
+}
+
+def _paginate(total: int, page: int, page_size: int) -> Tuple[int, int, int, bool, bool]:
+    """
+    Compute pagination bounds with integer arithmetic only.
+
+    Returns ``(start, end, total_pages, has_next, has_previous)`` where
+    ``start``/``end`` are 0-based row indices and ``end`` never precedes
+    ``start`` (pages past the end are simply empty).
+    """
+    total_pages = (total + page_size - 1) // page_size
+    start = (page - 1) * page_size
+    end = max(min(start + page_size, total), start)
+    return start, end, total_pages, page < total_pages, page > 1
+
+def _page_seed(endpoint_id: str, page: int, page_size: int) -> int:
+    """Stable seed for a page; unlike hash(), it is identical across processes."""
+    return zlib.crc32(f"{endpoint_id}:{page}:{page_size}".encode())
+
+# Generated pages take their created_at / last_login timestamp from the page
+# seed instead of the wall clock, so every worker and every cache refill
+# produces byte-identical JSON (and therefore the same ETag) for a page.
+_PAGE_TIME_ANCHOR = datetime(2024, 1, 1)
+_PAGE_TIME_SPAN_SECONDS = 365 * 24 * 60 * 60
+
+def _page_timestamp(seed: int) -> str:
+    """Deterministic ISO timestamp for a page, within the year after the anchor."""
+    return (_PAGE_TIME_ANCHOR + timedelta(seconds=seed % _PAGE_TIME_SPAN_SECONDS)).isoformat()
+
+# Number of serialized pages kept per worker. A 100-row page is roughly 50 KB
+# of JSON, so the default bounds the cache at about 50 MB in the worst case.
+# Negative values disable the cache, as they did for functools.lru_cache.
+PAGE_CACHE_SIZE = max(0, int(os.getenv("PAGE_CACHE_SIZE", "1024")))
+
+# LRU of serialized pages keyed by build_page's arguments. It is an explicit
+# OrderedDict rather than functools.lru_cache so the event loop can look a
+# page up without calling into (and possibly running) the generator. It is
+# only touched from the event loop thread, so it needs no lock.
+_PAGE_CACHE: "OrderedDict[Tuple[str, int, int, int], Tuple[bytes, str]]" = OrderedDict()
+
+# Builds currently running in the threadpool, by key, so concurrent misses
+# for the same page wait on one build instead of each generating it.
+_PAGE_BUILDS: "Dict[Tuple[str, int, int, int], asyncio.Task[Tuple[bytes, str]]]" = {}
+
+def build_page(endpoint_id: str, total: int, page_size: int, page: int) -> Tuple[bytes, str]:
+    """
+    Generate and serialize one page of synthetic data for an endpoint.
+    Returns the JSON body together with its ETag.
+
+    Only the rows of the requested page are generated, never the whole
+    ``total``, so the cost is O(page_size) regardless of the dataset size.
+    Rows are seeded from (endpoint_id, page, page_size) rather than from
+    ``total``, so a page is deterministic and the serialized bytes can be
+    cached by get_page(); repeat requests skip generation and serialization
+    entirely.
+
+    Pages are deliberately built whole rather than streamed row by row: a
+    full 100-row page generates in about a millisecond, and a complete body
+    is what lets it be cached, hashed for the ETag and sent with a
+    Content-Length.
+    """
+    start_index, end_index, total_pages, has_next, has_previous = _paginate(total, page, page_size)
     
-    # Generate random created datetime
-    created_datetime = datetime.now().replace(
-        year=random.randint(2020, 2024),
-        month=random.randint(1, 12),
-        day=random.randint(1, 28),
-        hour=random.randint(0, 23),
-        minute=random.randint(0, 59)
-    )
+    # Generate data for current page, sharing one seed-derived timestamp
+    # across rows. Pages past the end are empty, so skip seeding a generator.
+    data = []
+    if end_index > start_index:
+        seed = _page_seed(endpoint_id, page, page_size)
+        data = _PAGE_GENERATORS[endpoint_id](
+            start_index + 1,
+            end_index - start_index,
+            now_iso=_page_timestamp(seed),
+            seed=seed
+        )
     
-    return DataObjectWithDifferentDates(
-        id=id,
-        uuid=str(uuid.uuid4()),
-        name=f"User {generate_random_string(6)}",
-        email=generate_random_email(),
-        age=random.randint(18, 80),
-        height=round(random.uniform(150.0, 200.0), 2),
-        weight=round(random.uniform(45.0, 120.0), 2),
-        is_active=random.choice([True, False]),
-        balance=round(random.uniform(0.0, 100000.0), 2),
-        # Different birth date formats
-        birth_date_iso=birth_date_obj.isoformat(),  # 2023-12-25
-        birth_date_us=birth_date_obj.strftime("%m/%d/%Y"),  # 12/25/2023
-        birth_date_eu=birth_date_obj.strftime("%d/%m/%Y"),  # 25/12/2023
-        birth_date_long=birth_date_obj.strftime("%B %d, %Y"),  # December 25, 2023
-        # Different created_at formats
-        created_at_iso=created_datetime.isoformat(),  # 2023-12-25T10:30:00
-        created_at_timestamp=int(created_datetime.timestamp()),  # Unix timestamp
-        created_at_readable=created_datetime.strftime("%a, %b %d %Y %I:%M %p"),  # Mon, Dec 25 2023 10:30 AM
-        tags=generate_random_tags(),
-        metadata=generate_random_metadata(),
-        score=round(random.uniform(0.0, 100.0), 2) if random.choice([True, False]) else None,
-        description=f"This is a sample description for user {id}" if random.choice([True, False]) else None
-    )
+    # The page dict is plain Python data, so orjson encodes it in one
+    # traversal with no per-row or Pydantic serialization step
+    body = json_dumps({
+        "data": data,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": has_next,
+        "has_previous": has_previous
+    })
+    return body, make_etag(body)
+
+async def get_page(endpoint_id: str, total: int, page_size: int, page: int) -> Tuple[bytes, str]:
+    """
+    Return a page's body and ETag, generating it only on a cache miss.
+
+    Cache hits are answered on the event loop; a miss runs build_page() in
+    the threadpool so the CPU-bound generation never blocks the loop.
+    """
+    key = (endpoint_id, total, page_size, page)
+    cached = _PAGE_CACHE.get(key)
+    if cached is not None:
+        _PAGE_CACHE.move_to_end(key)
+        return cached
+
+    build = _PAGE_BUILDS.get(key)
+    if build is None:
+        build = _PAGE_BUILDS[key] = asyncio.ensure_future(_build_and_cache_page(key))
+    # Shielded so a disconnecting client does not cancel a build that other
+    # requests are waiting on
+    return await asyncio.shield(build)
+
+async def _build_and_cache_page(key: Tuple[str, int, int, int]) -> Tuple[bytes, str]:
+    """Build one page in the threadpool and store it in the page cache."""
+    try:
+        built = await run_in_threadpool(build_page, *key)
+        _PAGE_CACHE[key] = built
+        while len(_PAGE_CACHE) > PAGE_CACHE_SIZE:
+            _PAGE_CACHE.popitem(last=False)
+        return built
+    finally:
+        del _PAGE_BUILDS[key]
 
 # Fixed data sets for consistent API responses
 FIXED_USERS_DATA = [
@@ -432,965 +852,24 @@ FIXED_USERS_DATA = [
     }
 ]
 
-def get_fixed_data_objects(start_id: int = 1, count: int = 10) -> List[DataObject]:
-    """Get a fixed set of DataObject instances."""
-    result = []
-    for i in range(count):
-        data_index = i % len(FIXED_USERS_DATA)
-        user_data = FIXED_USERS_DATA[data_index].copy()
-        user_data["id"] = start_id + i
-        result.append(DataObject(**user_data))
-    return result
-
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main UI page."""
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>HTTP Data Serve API Explorer</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 15px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            
-            .header {
-                background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-                color: white;
-                padding: 30px;
-                text-align: center;
-            }
-            
-            .header h1 {
-                font-size: 2.5em;
-                margin-bottom: 10px;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            }
-            
-            .header p {
-                font-size: 1.2em;
-                opacity: 0.9;
-            }
-            
-            .content {
-                padding: 30px;
-            }
-            
-            .controls {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-                padding: 25px;
-                background: #f8f9fa;
-                border-radius: 10px;
-                border: 2px solid #e9ecef;
-            }
-            
-            .control-group {
-                display: flex;
-                flex-direction: column;
-            }
-            
-            .control-group label {
-                font-weight: 600;
-                color: #495057;
-                margin-bottom: 8px;
-                font-size: 0.9em;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            .control-group input, .control-group select, .control-group button {
-                padding: 12px 15px;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                font-size: 1em;
-                transition: all 0.3s ease;
-                background: white;
-            }
-            
-            .control-group input:focus, .control-group select:focus {
-                outline: none;
-                border-color: #4facfe;
-                box-shadow: 0 0 0 3px rgba(79, 172, 254, 0.1);
-            }
-            
-            .api-description {
-                background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 25px;
-                border: 2px solid #90caf9;
-            }
-            
-            .api-description h3 {
-                margin: 0 0 10px 0;
-                color: #1565c0;
-                font-size: 1.2em;
-            }
-            
-            .api-description p {
-                margin: 0;
-                color: #1976d2;
-                line-height: 1.5;
-            }
-            
-            .api-details {
-                background: linear-gradient(135deg, #f3e5f5 0%, #e1bee7 100%);
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 25px;
-                border: 2px solid #ce93d8;
-            }
-            
-            .api-details h4 {
-                margin: 0 0 15px 0;
-                color: #7b1fa2;
-                font-size: 1.1em;
-            }
-            
-            .parameters-section {
-                margin-bottom: 20px;
-            }
-            
-            .parameters-section ul {
-                margin: 0;
-                padding-left: 20px;
-                color: #8e24aa;
-            }
-            
-            .parameters-section li {
-                margin-bottom: 8px;
-                line-height: 1.4;
-            }
-            
-            .example-section code {
-                display: block;
-                background: #4a148c;
-                color: #e1bee7;
-                padding: 10px 15px;
-                border-radius: 5px;
-                font-family: 'Courier New', monospace;
-                font-size: 0.9em;
-                word-wrap: break-word;
-                margin: 0;
-            }
-            
-            .api-list-section {
-                margin-bottom: 30px;
-            }
-            
-            .api-list-section h3 {
-                text-align: center;
-                color: #495057;
-                margin-bottom: 25px;
-                font-size: 1.5em;
-            }
-            
-            .api-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 20px;
-                margin-bottom: 20px;
-            }
-            
-            .api-card {
-                background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%);
-                border: 2px solid #ffcc02;
-                border-radius: 12px;
-                padding: 20px;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .api-card:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 8px 25px rgba(255, 204, 2, 0.3);
-                border-color: #ff9800;
-            }
-            
-            .api-card.selected {
-                border-color: #ff5722;
-                background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
-                box-shadow: 0 8px 25px rgba(255, 87, 34, 0.3);
-            }
-            
-            .api-card-header {
-                display: flex;
-                align-items: center;
-                margin-bottom: 12px;
-            }
-            
-            .api-card-icon {
-                font-size: 2em;
-                margin-right: 12px;
-            }
-            
-            .api-card-title {
-                font-size: 1.2em;
-                font-weight: 600;
-                color: #e65100;
-                margin: 0;
-            }
-            
-            .api-card-path {
-                font-family: 'Courier New', monospace;
-                background: rgba(0,0,0,0.1);
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 0.8em;
-                color: #bf360c;
-                margin-bottom: 10px;
-            }
-            
-            .api-card-description {
-                color: #f57c00;
-                font-size: 0.9em;
-                line-height: 1.4;
-                margin-bottom: 15px;
-            }
-            
-            .api-card-actions {
-                display: flex;
-                gap: 10px;
-                flex-wrap: wrap;
-            }
-            
-            .api-action-btn {
-                background: #ff5722;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 6px;
-                font-size: 0.8em;
-                cursor: pointer;
-                transition: background 0.3s ease;
-                font-weight: 500;
-            }
-            
-            .api-action-btn:hover {
-                background: #d84315;
-            }
-            
-            .api-action-btn.secondary {
-                background: #757575;
-            }
-            
-            .api-action-btn.secondary:hover {
-                background: #424242;
-            }
-            
-            .fetch-btn {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                cursor: pointer;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            
-            .fetch-btn:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            
-            .fetch-btn:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-                transform: none;
-            }
-            
-            .info-section {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 15px;
-                margin-bottom: 25px;
-            }
-            
-            .info-card {
-                background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
-                padding: 20px;
-                border-radius: 10px;
-                text-align: center;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }
-            
-            .info-card h3 {
-                font-size: 2em;
-                color: #8b4513;
-                margin-bottom: 5px;
-            }
-            
-            .info-card p {
-                color: #a0522d;
-                font-weight: 500;
-                text-transform: uppercase;
-                font-size: 0.8em;
-                letter-spacing: 1px;
-            }
-            
-            .pagination {
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                gap: 10px;
-                margin: 25px 0;
-                flex-wrap: wrap;
-            }
-            
-            .pagination button {
-                padding: 10px 15px;
-                border: 2px solid #dee2e6;
-                background: white;
-                border-radius: 8px;
-                cursor: pointer;
-                font-weight: 500;
-                transition: all 0.3s ease;
-            }
-            
-            .pagination button:hover:not(:disabled) {
-                background: #4facfe;
-                color: white;
-                border-color: #4facfe;
-            }
-            
-            .pagination button:disabled {
-                opacity: 0.5;
-                cursor: not-allowed;
-            }
-            
-            .pagination .current-page {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border-color: #667eea;
-            }
-            
-            .response-container {
-                background: #f8f9fa;
-                border-radius: 10px;
-                overflow: hidden;
-                border: 2px solid #e9ecef;
-            }
-            
-            .response-header {
-                background: #343a40;
-                color: white;
-                padding: 15px 20px;
-                font-weight: 600;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            }
-            
-            .copy-btn {
-                background: #28a745;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-size: 0.8em;
-                transition: background 0.3s ease;
-            }
-            
-            .copy-btn:hover {
-                background: #218838;
-            }
-            
-            .json-response {
-                padding: 20px;
-                font-family: 'Courier New', monospace;
-                font-size: 0.9em;
-                line-height: 1.6;
-                max-height: 600px;
-                overflow-y: auto;
-                white-space: pre-wrap;
-                word-wrap: break-word;
-                background: #ffffff;
-            }
-            
-            .loading {
-                text-align: center;
-                padding: 40px;
-                color: #6c757d;
-                font-style: italic;
-            }
-            
-            .error {
-                background: #f8d7da;
-                color: #721c24;
-                padding: 20px;
-                border-radius: 8px;
-                margin: 20px 0;
-                border: 1px solid #f5c6cb;
-            }
-            
-            @media (max-width: 768px) {
-                .controls {
-                    grid-template-columns: 1fr;
-                }
-                
-                .info-section {
-                    grid-template-columns: repeat(2, 1fr);
-                }
-                
-                .pagination {
-                    justify-content: center;
-                }
-                
-                .header h1 {
-                    font-size: 2em;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🚀 HTTP Data Serve API</h1>
-                <p>Explore JSON data with various data types and pagination</p>
-            </div>
-            
-            <div class="content">
-                <div class="controls">
-                    <div class="control-group">
-                        <label for="apiType">Select API Endpoint</label>
-                        <select id="apiType" onchange="updateApiDescription()">
-                            <option value="">Loading APIs...</option>
-                        </select>
-                    </div>
-                    <div class="control-group" id="totalRecordsGroup">
-                        <label for="totalRecords">Total Records</label>
-                        <input type="number" id="totalRecords" min="1" max="10000" value="1000">
-                    </div>
-                    <div class="control-group" id="pageSizeGroup">
-                        <label for="pageSize">Page Size</label>
-                        <input type="number" id="pageSize" min="1" max="100" value="10">
-                    </div>
-                    <div class="control-group" id="currentPageGroup">
-                        <label for="currentPage">Current Page</label>
-                        <input type="number" id="currentPage" min="1" value="1">
-                    </div>
-                    <div class="control-group">
-                        <label>&nbsp;</label>
-                        <button class="fetch-btn" onclick="fetchData()" id="fetchBtn" disabled>Fetch Data</button>
-                    </div>
-                </div>
-                
-                <div class="api-list-section" id="apiListSection">
-                    <h3>🔄 Loading Available APIs...</h3>
-                    <div class="api-grid" id="apiGrid">
-                        <!-- APIs will be loaded here -->
-                    </div>
-                </div>
-                
-                <div class="api-description" id="apiDescription" style="display: none;">
-                    <h3>📊 Selected API</h3>
-                    <p>Select an API from the list above to see details and make requests.</p>
-                </div>
-                
-                <div class="api-details" id="apiDetails" style="display: none;">
-                    <div class="parameters-section">
-                        <h4>📋 Parameters</h4>
-                        <ul id="parametersList"></ul>
-                    </div>
-                    <div class="example-section">
-                        <h4>💡 Example URL</h4>
-                        <code id="exampleUrl"></code>
-                    </div>
-                </div>
-                
-                <div class="info-section" id="infoSection" style="display: none;">
-                    <div class="info-card">
-                        <h3 id="totalItems">-</h3>
-                        <p>Total Items</p>
-                    </div>
-                    <div class="info-card">
-                        <h3 id="currentPageInfo">-</h3>
-                        <p>Current Page</p>
-                    </div>
-                    <div class="info-card">
-                        <h3 id="totalPages">-</h3>
-                        <p>Total Pages</p>
-                    </div>
-                    <div class="info-card">
-                        <h3 id="itemsShown">-</h3>
-                        <p>Items Shown</p>
-                    </div>
-                </div>
-                
-                <div class="pagination" id="pagination" style="display: none;"></div>
-                
-                <div class="response-container">
-                    <div class="response-header">
-                        <span>API Response</span>
-                        <button class="copy-btn" onclick="copyResponse()">Copy JSON</button>
-                    </div>
-                    <div class="json-response" id="jsonResponse">
-                        <div class="loading">👋 Welcome! Click "Fetch Data" to explore the API response</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <script>
-            let currentResponse = null;
-            let availableEndpoints = [];
-
-            async function loadAvailableEndpoints() {
-                try {
-                    const response = await fetch('/api/endpoints');
-                    const data = await response.json();
-                    availableEndpoints = data.endpoints;
-                    
-                    // Create API grid
-                    createApiGrid();
-                    
-                    // Populate the dropdown (keep for compatibility)
-                    const select = document.getElementById('apiType');
-                    select.innerHTML = '';
-                    
-                    availableEndpoints.forEach((endpoint, index) => {
-                        const option = document.createElement('option');
-                        option.value = endpoint.path;
-                        option.textContent = endpoint.name;
-                        select.appendChild(option);
-                    });
-                    
-                    // Select the first endpoint by default
-                    if (availableEndpoints.length > 0) {
-                        select.value = availableEndpoints[0].path;
-                        document.getElementById('fetchBtn').disabled = false;
-                    }
-                    
-                } catch (error) {
-                    console.error('Failed to load endpoints:', error);
-                    document.getElementById('apiListSection').innerHTML = `
-                        <div class="error">❌ Failed to load API endpoints: ${error.message}</div>
-                    `;
-                }
-            }
-
-            function createApiGrid() {
-                const gridContainer = document.getElementById('apiGrid');
-                const sectionTitle = document.querySelector('#apiListSection h3');
-                
-                sectionTitle.textContent = '🚀 Available API Endpoints';
-                gridContainer.innerHTML = '';
-                
-                availableEndpoints.forEach((endpoint, index) => {
-                    const card = document.createElement('div');
-                    card.className = 'api-card';
-                    card.setAttribute('data-endpoint', endpoint.path);
-                    
-                    // Determine icon
-                    let icon = '📊';
-                    if (endpoint.path.includes('date-formats')) icon = '🗓️';
-                    else if (endpoint.path.includes('schema')) icon = '🔍';
-                    else if (endpoint.path.includes('endpoints')) icon = '📋';
-                    
-                    // Create action buttons
-                    let actionButtons = '';
-                    if (endpoint.parameters && endpoint.parameters.length > 0) {
-                        actionButtons = `
-                            <button class="api-action-btn" onclick="quickFetch('${endpoint.path}', 'default')">
-                                🚀 Quick Fetch
-                            </button>
-                            <button class="api-action-btn secondary" onclick="selectApiForCustomization('${endpoint.path}')">
-                                ⚙️ Customize
-                            </button>
-                        `;
-                    } else {
-                        actionButtons = `
-                            <button class="api-action-btn" onclick="quickFetch('${endpoint.path}', 'simple')">
-                                🚀 Fetch Data
-                            </button>
-                        `;
-                    }
-                    
-                    // Special fields info
-                    let specialFieldsInfo = '';
-                    if (endpoint.special_fields) {
-                        const fieldsPreview = endpoint.special_fields.slice(0, 3).join(', ');
-                        specialFieldsInfo = `
-                            <div style="margin-top: 10px; padding: 8px; background: rgba(0,0,0,0.05); border-radius: 6px; font-size: 0.8em;">
-                                <strong>Special Fields:</strong> ${fieldsPreview}${endpoint.special_fields.length > 3 ? '...' : ''}
-                            </div>
-                        `;
-                    }
-                    
-                    card.innerHTML = `
-                        <div class="api-card-header">
-                            <span class="api-card-icon">${icon}</span>
-                            <h4 class="api-card-title">${endpoint.name}</h4>
-                        </div>
-                        <div class="api-card-path">${endpoint.path}</div>
-                        <div class="api-card-description">${endpoint.description}</div>
-                        ${specialFieldsInfo}
-                        <div class="api-card-actions">
-                            ${actionButtons}
-                        </div>
-                    `;
-                    
-                    gridContainer.appendChild(card);
-                });
-            }
-
-            function updateApiDescription() {
-                const selectedPath = document.getElementById('apiType').value;
-                const endpoint = availableEndpoints.find(ep => ep.path === selectedPath);
-                
-                if (!endpoint) return;
-                
-                const descriptionDiv = document.getElementById('apiDescription');
-                const detailsDiv = document.getElementById('apiDetails');
-                
-                // Update description
-                let icon = '📊';
-                if (endpoint.path.includes('date-formats')) icon = '🗓️';
-                else if (endpoint.path.includes('schema')) icon = '🔍';
-                
-                descriptionDiv.innerHTML = `
-                    <h3>${icon} ${endpoint.name}</h3>
-                    <p>${endpoint.description}</p>
-                `;
-                
-                // Update details
-                if (endpoint.parameters && endpoint.parameters.length > 0) {
-                    const parametersList = document.getElementById('parametersList');
-                    parametersList.innerHTML = '';
-                    
-                    endpoint.parameters.forEach(param => {
-                        const li = document.createElement('li');
-                        li.innerHTML = `<strong>${param.name}</strong> (${param.type}): ${param.description} <em>Default: ${param.default}</em>`;
-                        parametersList.appendChild(li);
-                    });
-                    
-                    document.getElementById('exampleUrl').textContent = endpoint.example;
-                    detailsDiv.style.display = 'block';
-                    
-                    // Show/hide parameter controls based on endpoint
-                    const hasDataParams = endpoint.parameters.some(p => ['page', 'page_size', 'total_records'].includes(p.name));
-                    document.getElementById('totalRecordsGroup').style.display = hasDataParams ? 'flex' : 'none';
-                    document.getElementById('pageSizeGroup').style.display = hasDataParams ? 'flex' : 'none';
-                    document.getElementById('currentPageGroup').style.display = hasDataParams ? 'flex' : 'none';
-                } else {
-                    detailsDiv.style.display = 'none';
-                    // Hide pagination controls for schema endpoint
-                    document.getElementById('totalRecordsGroup').style.display = 'none';
-                    document.getElementById('pageSizeGroup').style.display = 'none';
-                    document.getElementById('currentPageGroup').style.display = 'none';
-                }
-                
-                // Show special fields for date formats API
-                if (endpoint.special_fields) {
-                    const specialFieldsHtml = endpoint.special_fields.map(field => `<li>${field}</li>`).join('');
-                    descriptionDiv.innerHTML += `
-                        <div style="margin-top: 15px;">
-                            <h4 style="color: #1565c0; margin-bottom: 10px;">🗓️ Special Date Fields:</h4>
-                            <ul style="color: #1976d2; padding-left: 20px; margin: 0;">
-                                ${specialFieldsHtml}
-                            </ul>
-                        </div>
-                    `;
-                }
-            }
-
-            async function quickFetch(apiPath, type = 'default') {
-                const responseDiv = document.getElementById('jsonResponse');
-                responseDiv.innerHTML = '<div class="loading">🔄 Loading data...</div>';
-                
-                // Clear previous selections
-                document.querySelectorAll('.api-card').forEach(card => {
-                    card.classList.remove('selected');
-                });
-                
-                // Highlight selected card
-                const selectedCard = document.querySelector(`[data-endpoint="${apiPath}"]`);
-                if (selectedCard) {
-                    selectedCard.classList.add('selected');
-                }
-                
-                try {
-                    let url = apiPath;
-                    
-                    // Add default parameters for data endpoints
-                    if (type === 'default' && (apiPath.includes('/api/data'))) {
-                        const totalRecords = document.getElementById('totalRecords').value || 1000;
-                        const pageSize = document.getElementById('pageSize').value || 10;
-                        const page = document.getElementById('currentPage').value || 1;
-                        url += `?page=${page}&page_size=${pageSize}&total_records=${totalRecords}`;
-                    }
-                    
-                    const response = await fetch(url);
-                    const data = await response.json();
-                    
-                    if (!response.ok) {
-                        throw new Error(data.detail || 'Failed to fetch data');
-                    }
-                    
-                    currentResponse = data;
-                    displayResponse(data);
-                    
-                    // Update info and pagination for data endpoints
-                    if (data.total !== undefined) {
-                        updateInfo(data);
-                        updatePagination(data);
-                        document.getElementById('infoSection').style.display = 'grid';
-                        document.getElementById('pagination').style.display = 'flex';
-                    } else {
-                        document.getElementById('infoSection').style.display = 'none';
-                        document.getElementById('pagination').style.display = 'none';
-                    }
-                    
-                    // Show endpoint details
-                    const endpoint = availableEndpoints.find(ep => ep.path === apiPath);
-                    if (endpoint) {
-                        showApiDetails(endpoint);
-                    }
-                    
-                } catch (error) {
-                    responseDiv.innerHTML = `<div class="error">❌ Error: ${error.message}</div>`;
-                }
-            }
-
-            function selectApiForCustomization(apiPath) {
-                // Clear previous selections
-                document.querySelectorAll('.api-card').forEach(card => {
-                    card.classList.remove('selected');
-                });
-                
-                // Highlight selected card
-                const selectedCard = document.querySelector(`[data-endpoint="${apiPath}"]`);
-                if (selectedCard) {
-                    selectedCard.classList.add('selected');
-                }
-                
-                // Update dropdown to match selection
-                document.getElementById('apiType').value = apiPath;
-                
-                // Show endpoint details
-                const endpoint = availableEndpoints.find(ep => ep.path === apiPath);
-                if (endpoint) {
-                    showApiDetails(endpoint);
-                }
-                
-                // Show/hide controls based on endpoint type
-                const hasDataParams = endpoint.parameters && endpoint.parameters.some(p => ['page', 'page_size', 'total_records'].includes(p.name));
-                document.getElementById('totalRecordsGroup').style.display = hasDataParams ? 'flex' : 'none';
-                document.getElementById('pageSizeGroup').style.display = hasDataParams ? 'flex' : 'none';
-                document.getElementById('currentPageGroup').style.display = hasDataParams ? 'flex' : 'none';
-                
-                // Scroll to controls
-                document.querySelector('.controls').scrollIntoView({ behavior: 'smooth' });
-            }
-
-            function showApiDetails(endpoint) {
-                const descriptionDiv = document.getElementById('apiDescription');
-                const detailsDiv = document.getElementById('apiDetails');
-                
-                // Update description
-                let icon = '📊';
-                if (endpoint.path.includes('date-formats')) icon = '🗓️';
-                else if (endpoint.path.includes('schema')) icon = '🔍';
-                
-                descriptionDiv.innerHTML = `
-                    <h3>${icon} ${endpoint.name}</h3>
-                    <p>${endpoint.description}</p>
-                `;
-                
-                // Update details
-                if (endpoint.parameters && endpoint.parameters.length > 0) {
-                    const parametersList = document.getElementById('parametersList');
-                    parametersList.innerHTML = '';
-                    
-                    endpoint.parameters.forEach(param => {
-                        const li = document.createElement('li');
-                        li.innerHTML = `<strong>${param.name}</strong> (${param.type}): ${param.description} <em>Default: ${param.default}</em>`;
-                        parametersList.appendChild(li);
-                    });
-                    
-                    document.getElementById('exampleUrl').textContent = endpoint.example;
-                    detailsDiv.style.display = 'block';
-                } else {
-                    detailsDiv.style.display = 'none';
-                }
-                
-                // Show special fields for date formats API
-                if (endpoint.special_fields) {
-                    const specialFieldsHtml = endpoint.special_fields.map(field => `<li>${field}</li>`).join('');
-                    descriptionDiv.innerHTML += `
-                        <div style="margin-top: 15px;">
-                            <h4 style="color: #1565c0; margin-bottom: 10px;">🗓️ Special Date Fields:</h4>
-                            <ul style="color: #1976d2; padding-left: 20px; margin: 0;">
-                                ${specialFieldsHtml}
-                            </ul>
-                        </div>
-                    `;
-                }
-                
-                descriptionDiv.style.display = 'block';
-            }
-
-            async function fetchData() {
-                const selectedPath = document.getElementById('apiType').value;
-                const endpoint = availableEndpoints.find(ep => ep.path === selectedPath);
-                const responseDiv = document.getElementById('jsonResponse');
-                
-                if (!endpoint) {
-                    responseDiv.innerHTML = '<div class="error">❌ No endpoint selected</div>';
-                    return;
-                }
-                
-                // Show loading
-                responseDiv.innerHTML = '<div class="loading">🔄 Loading data...</div>';
-                
-                try {
-                    let url = endpoint.path;
-                    
-                    // Add parameters if the endpoint supports them
-                    const hasDataParams = endpoint.parameters && endpoint.parameters.some(p => ['page', 'page_size', 'total_records'].includes(p.name));
-                    
-                    if (hasDataParams) {
-                        const pageSize = document.getElementById('pageSize').value;
-                        const page = document.getElementById('currentPage').value;
-                        const totalRecords = document.getElementById('totalRecords').value;
-                        url += `?page=${page}&page_size=${pageSize}&total_records=${totalRecords}`;
-                    }
-                    
-                    const response = await fetch(url);
-                    const data = await response.json();
-                    
-                    if (!response.ok) {
-                        throw new Error(data.detail || 'Failed to fetch data');
-                    }
-                    
-                    currentResponse = data;
-                    displayResponse(data);
-                    
-                    // Only update pagination info for data endpoints
-                    if (hasDataParams && data.total !== undefined) {
-                        updateInfo(data);
-                        updatePagination(data);
-                    } else {
-                        // Hide pagination for non-data endpoints
-                        document.getElementById('infoSection').style.display = 'none';
-                        document.getElementById('pagination').style.display = 'none';
-                    }
-                    
-                } catch (error) {
-                    responseDiv.innerHTML = `<div class="error">❌ Error: ${error.message}</div>`;
-                }
-            }
-
-            function displayResponse(data) {
-                const responseDiv = document.getElementById('jsonResponse');
-                responseDiv.textContent = JSON.stringify(data, null, 2);
-            }
-
-            function updateInfo(data) {
-                document.getElementById('totalItems').textContent = data.total;
-                document.getElementById('currentPageInfo').textContent = data.page;
-                document.getElementById('totalPages').textContent = data.total_pages;
-                document.getElementById('itemsShown').textContent = data.data.length;
-                document.getElementById('infoSection').style.display = 'grid';
-            }
-
-            function updatePagination(data) {
-                const paginationDiv = document.getElementById('pagination');
-                paginationDiv.innerHTML = '';
-                
-                // Previous button
-                const prevBtn = document.createElement('button');
-                prevBtn.textContent = '← Previous';
-                prevBtn.disabled = !data.has_previous;
-                prevBtn.onclick = () => goToPage(data.page - 1);
-                paginationDiv.appendChild(prevBtn);
-                
-                // Page numbers
-                const startPage = Math.max(1, data.page - 2);
-                const endPage = Math.min(data.total_pages, data.page + 2);
-                
-                for (let i = startPage; i <= endPage; i++) {
-                    const pageBtn = document.createElement('button');
-                    pageBtn.textContent = i;
-                    pageBtn.onclick = () => goToPage(i);
-                    if (i === data.page) {
-                        pageBtn.className = 'current-page';
-                    }
-                    paginationDiv.appendChild(pageBtn);
-                }
-                
-                // Next button
-                const nextBtn = document.createElement('button');
-                nextBtn.textContent = 'Next →';
-                nextBtn.disabled = !data.has_next;
-                nextBtn.onclick = () => goToPage(data.page + 1);
-                paginationDiv.appendChild(nextBtn);
-                
-                paginationDiv.style.display = 'flex';
-            }
-
-            function goToPage(page) {
-                document.getElementById('currentPage').value = page;
-                fetchData();
-            }
-
-            function copyResponse() {
-                if (currentResponse) {
-                    navigator.clipboard.writeText(JSON.stringify(currentResponse, null, 2))
-                        .then(() => {
-                            const btn = document.querySelector('.copy-btn');
-                            const originalText = btn.textContent;
-                            btn.textContent = '✅ Copied!';
-                            setTimeout(() => {
-                                btn.textContent = originalText;
-                            }, 2000);
-                        })
-                        .catch(err => {
-                            console.error('Failed to copy: ', err);
-                        });
-                }
-            }
+def get_fixed_data_objects(start_id: int = 1, count: int = 10) -> List[Dict[str, Any]]:
+    """
+    Get a fixed set of rows shaped like DataObject.
 
-            // Load available endpoints and initial data
-            window.onload = async () => {
-                await loadAvailableEndpoints();
-                // Don't auto-fetch data anymore, let user choose
-            };
-        </script>
-    </body>
-    </html>
+    The fixed records already have DataObject's keys in field order, so they
+    are returned as plain dicts and serialized without building instances.
     """
+    return [
+        {**FIXED_USERS_DATA[i % len(FIXED_USERS_DATA)], "id": start_id + i}
+        for i in range(count)
+    ]
 
-@app.get("/api/data", response_model=PaginatedResponse)
+# The generated-data endpoints serve cached pages straight from the event loop
+# and only hand cache misses to the threadpool (see get_page), instead of
+# paying a thread hop on every request as plain def endpoints would.
+@app.get("/api/data", responses={200: {"model": PaginatedResponse}})
 async def get_data(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     total_records: int = Query(1000, ge=1, le=10000, description="Total number of records to generate (1-10000)")
@@ -1418,33 +897,20 @@ async def get_data(
     - **metadata**: object with nested properties
     - **score**: float (nullable)
     - **description**: string (nullable)
+
+    **created_at** and **metadata.last_login** are not real creation or login
+    times: they hold one deterministic per-page placeholder timestamp (in
+    2024, derived from the page seed), shared by every row of the page.
     """
     
-    # Use user-specified total records
-    total_items = total_records
-    
-    # Calculate pagination
-    total_pages = (total_items + page_size - 1) // page_size
-    start_index = (page - 1) * page_size
-    end_index = min(start_index + page_size, total_items)
-    
-    # Generate data for current page
-    data = []
-    for i in range(start_index, end_index):
-        data.append(generate_data_object(i + 1))
-    
-    return PaginatedResponse(
-        data=data,
-        total=total_items,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
+    # Return the response directly so FastAPI skips response_model validation
+    # and jsonable_encoder; PaginatedResponse is only used for the OpenAPI docs.
+    content, etag = await get_page("data", total_records, page_size, page)
+    return cached_json_response(request, content, etag)
 
-@app.get("/api/data-with-date-formats", response_model=PaginatedResponseWithDifferentDates)
+@app.get("/api/data-with-date-formats", responses={200: {"model": PaginatedResponseWithDifferentDates}})
 async def get_data_with_date_formats(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     total_records: int = Query(1000, ge=1, le=10000, description="Total number of records to generate (1-10000)")
@@ -1466,33 +932,19 @@ async def get_data_with_date_formats(
     - **created_at_readable**: string (Readable: Mon, Dec 25 2023 10:30 AM)
     
     Plus all other data types from the standard API.
+
+    The created_at_* values are drawn per row from the page seed;
+    **metadata.last_login** is a deterministic per-page placeholder timestamp
+    shared by every row of the page, not a real login time.
     """
     
-    # Use user-specified total records
-    total_items = total_records
-    
-    # Calculate pagination
-    total_pages = (total_items + page_size - 1) // page_size
-    start_index = (page - 1) * page_size
-    end_index = min(start_index + page_size, total_items)
-    
-    # Generate data for current page
-    data = []
-    for i in range(start_index, end_index):
-        data.append(generate_data_object_with_different_dates(i + 1))
-    
-    return PaginatedResponseWithDifferentDates(
-        data=data,
-        total=total_items,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
+    # As with /api/data, PaginatedResponseWithDifferentDates only documents the
+    # response shape; the dict is serialized directly without re-validation.
+    content, etag = await get_page("data-with-date-formats", total_records, page_size, page)
+    return cached_json_response(request, content, etag)
 
 # Fixed data endpoints
-@app.get("/api/fixed-data", response_model=FixedPaginatedResponse)
+@app.get("/api/fixed-data", responses={200: {"model": FixedPaginatedResponse}})
 async def get_fixed_data(
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page")
@@ -1513,25 +965,22 @@ async def get_fixed_data(
     # Fixed total of 10 users
     total_items = len(FIXED_USERS_DATA)
     
-    # Calculate pagination
-    total_pages = (total_items + page_size - 1) // page_size
-    start_index = (page - 1) * page_size
-    end_index = min(start_index + page_size, total_items)
+    start_index, end_index, total_pages, has_next, has_previous = _paginate(total_items, page, page_size)
     
     # Get fixed data for current page
     data = get_fixed_data_objects(start_index + 1, end_index - start_index)
     
-    return FixedPaginatedResponse(
-        data=data,
-        total=total_items,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
+    return FastJSONResponse({
+        "data": data,
+        "total": total_items,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": has_next,
+        "has_previous": has_previous
+    })
 
-@app.get("/api/fixed-users", response_model=SimpleResponse)
+@app.get("/api/fixed-users", responses={200: {"model": SimpleResponse}})
 async def get_fixed_users():
     """
     Get all fixed users as a simple response.
@@ -1546,13 +995,13 @@ async def get_fixed_users():
     """
     data = get_fixed_data_objects(1, len(FIXED_USERS_DATA))
     
-    return SimpleResponse(
-        data=data,
-        message="Fixed user data retrieved successfully",
-        timestamp=datetime.now().isoformat()
-    )
+    return FastJSONResponse({
+        "data": data,
+        "message": "Fixed user data retrieved successfully",
+        "timestamp": datetime.now().isoformat()
+    })
 
-@app.get("/api/fixed-sample", response_model=List[DataObject])
+@app.get("/api/fixed-sample", responses={200: {"model": List[DataObject]}})
 async def get_fixed_sample(
     count: int = Query(5, ge=1, le=10, description="Number of sample records to return")
 ):
@@ -1564,7 +1013,7 @@ async def get_fixed_sample(
     
     - **count**: Number of records to return (1-10, default: 5)
     """
-    return get_fixed_data_objects(1, count)
+    return FastJSONResponse(get_fixed_data_objects(1, count))
 
 @app.get("/api/fixed-by-department/{department}")
 async def get_fixed_by_department(department: str):
@@ -1587,22 +1036,22 @@ async def get_fixed_by_department(department: str):
     department_users = []
     for user_data in FIXED_USERS_DATA:
         if user_data["metadata"]["department"].lower() == department.lower():
-            department_users.append(DataObject(**user_data))
+            department_users.append(user_data)
     
     if not department_users:
         available_depts = list(set([user["metadata"]["department"] for user in FIXED_USERS_DATA]))
-        return {
+        return FastJSONResponse({
             "error": f"Department '{department}' not found",
             "available_departments": available_depts,
             "message": "Please use one of the available departments"
-        }
+        })
     
-    return {
+    return FastJSONResponse({
         "department": department,
         "users": department_users,
         "count": len(department_users),
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 @app.get("/api/fixed-active-users")
 async def get_fixed_active_users():
@@ -1615,132 +1064,145 @@ async def get_fixed_active_users():
     active_users = []
     for user_data in FIXED_USERS_DATA:
         if user_data["is_active"]:
-            active_users.append(DataObject(**user_data))
+            active_users.append(user_data)
     
-    return {
+    return FastJSONResponse({
         "active_users": active_users,
         "total_active": len(active_users),
         "total_users": len(FIXED_USERS_DATA),
         "message": "Active users from fixed dataset",
         "timestamp": datetime.now().isoformat()
-    }
+    })
+
+# Endpoint metadata never changes, so it is serialized once at import
+API_ENDPOINTS = {
+    "endpoints": [
+        {
+            "path": "/api/data",
+            "name": "Standard Data API",
+            "description": "Returns JSON objects with standard date formats (ISO) and all common data types including integers, floats, booleans, strings, arrays, and objects.",
+            "parameters": [
+                {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
+                {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"},
+                {"name": "total_records", "type": "integer", "default": 1000, "description": "Total number of records to generate (1-10000)"}
+            ],
+            "example": "/api/data?page=1&page_size=10&total_records=500"
+        },
+        {
+            "path": "/api/data-with-date-formats",
+            "name": "Date Formats API",
+            "description": "Returns JSON objects with multiple date format variations including ISO, US, EU, long format, timestamps, and readable formats. Perfect for testing different date parsing scenarios.",
+            "parameters": [
+                {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
+                {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"},
+                {"name": "total_records", "type": "integer", "default": 1000, "description": "Total number of records to generate (1-10000)"}
+            ],
+            "example": "/api/data-with-date-formats?page=1&page_size=10&total_records=500",
+            "special_fields": [
+                "birth_date_iso (ISO format: 2023-12-25)",
+                "birth_date_us (US format: 12/25/2023)",
+                "birth_date_eu (EU format: 25/12/2023)",
+                "birth_date_long (Long format: December 25, 2023)",
+                "created_at_iso (ISO datetime: 2023-12-25T10:30:00)",
+                "created_at_timestamp (Unix timestamp: 1703505000)",
+                "created_at_readable (Readable: Mon, Dec 25 2023 10:30 AM)"
+            ]
+        },
+        {
+            "path": "/api/fixed-data",
+            "name": "Fixed Data API",
+            "description": "Returns consistent, predefined data that never changes. Perfect for testing, demos, and scenarios requiring predictable responses. Contains 10 realistic user records.",
+            "parameters": [
+                {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
+                {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"}
+            ],
+            "example": "/api/fixed-data?page=1&page_size=5"
+        },
+        {
+            "path": "/api/fixed-users",
+            "name": "Fixed Users API",
+            "description": "Returns all 10 predefined users in a simple response format without pagination. Includes a success message and timestamp.",
+            "parameters": [],
+            "example": "/api/fixed-users"
+        },
+        {
+            "path": "/api/fixed-sample",
+            "name": "Fixed Sample API",
+            "description": "Returns a specified number of fixed user records (1-10). Useful for getting just a few consistent records for testing.",
+            "parameters": [
+                {"name": "count", "type": "integer", "default": 5, "description": "Number of sample records to return (1-10)"}
+            ],
+            "example": "/api/fixed-sample?count=3"
+        },
+        {
+            "path": "/api/fixed-by-department/{department}",
+            "name": "Fixed Users by Department",
+            "description": "Returns fixed users filtered by department. Available departments: Engineering, Data Science, DevOps, Mobile, Management, Design, Data Engineering, Quality Assurance, Security.",
+            "parameters": [
+                {"name": "department", "type": "string", "default": "Engineering", "description": "Department name to filter by"}
+            ],
+            "example": "/api/fixed-by-department/Engineering"
+        },
+        {
+            "path": "/api/fixed-active-users",
+            "name": "Fixed Active Users API",
+            "description": "Returns only active users (is_active = true) from the fixed dataset. Includes statistics about active vs total users.",
+            "parameters": [],
+            "example": "/api/fixed-active-users"
+        },
+        {
+            "path": "/api/schema",
+            "name": "Schema API",
+            "description": "Returns the JSON schema for the data objects, useful for validation and understanding the data structure.",
+            "parameters": [],
+            "example": "/api/schema"
+        }
+    ]
+}
+_API_ENDPOINTS_JSON = json_dumps(API_ENDPOINTS)
+_API_ENDPOINTS_ETAG = make_etag(_API_ENDPOINTS_JSON)
 
 @app.get("/api/endpoints")
-async def get_available_endpoints():
+async def get_available_endpoints(request: Request):
     """Get all available API endpoints with their descriptions."""
-    return {
-        "endpoints": [
-            {
-                "path": "/api/data",
-                "name": "Standard Data API",
-                "description": "Returns JSON objects with standard date formats (ISO) and all common data types including integers, floats, booleans, strings, arrays, and objects.",
-                "parameters": [
-                    {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
-                    {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"},
-                    {"name": "total_records", "type": "integer", "default": 1000, "description": "Total number of records to generate (1-10000)"}
-                ],
-                "example": "/api/data?page=1&page_size=10&total_records=500"
-            },
-            {
-                "path": "/api/data-with-date-formats",
-                "name": "Date Formats API",
-                "description": "Returns JSON objects with multiple date format variations including ISO, US, EU, long format, timestamps, and readable formats. Perfect for testing different date parsing scenarios.",
-                "parameters": [
-                    {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
-                    {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"},
-                    {"name": "total_records", "type": "integer", "default": 1000, "description": "Total number of records to generate (1-10000)"}
-                ],
-                "example": "/api/data-with-date-formats?page=1&page_size=10&total_records=500",
-                "special_fields": [
-                    "birth_date_iso (ISO format: 2023-12-25)",
-                    "birth_date_us (US format: 12/25/2023)",
-                    "birth_date_eu (EU format: 25/12/2023)",
-                    "birth_date_long (Long format: December 25, 2023)",
-                    "created_at_iso (ISO datetime: 2023-12-25T10:30:00)",
-                    "created_at_timestamp (Unix timestamp: 1703505000)",
-                    "created_at_readable (Readable: Mon, Dec 25 2023 10:30 AM)"
-                ]
-            },
-            {
-                "path": "/api/fixed-data",
-                "name": "Fixed Data API",
-                "description": "Returns consistent, predefined data that never changes. Perfect for testing, demos, and scenarios requiring predictable responses. Contains 10 realistic user records.",
-                "parameters": [
-                    {"name": "page", "type": "integer", "default": 1, "description": "Page number (starts from 1)"},
-                    {"name": "page_size", "type": "integer", "default": 10, "description": "Number of items per page (1-100)"}
-                ],
-                "example": "/api/fixed-data?page=1&page_size=5"
-            },
-            {
-                "path": "/api/fixed-users",
-                "name": "Fixed Users API",
-                "description": "Returns all 10 predefined users in a simple response format without pagination. Includes a success message and timestamp.",
-                "parameters": [],
-                "example": "/api/fixed-users"
-            },
-            {
-                "path": "/api/fixed-sample",
-                "name": "Fixed Sample API",
-                "description": "Returns a specified number of fixed user records (1-10). Useful for getting just a few consistent records for testing.",
-                "parameters": [
-                    {"name": "count", "type": "integer", "default": 5, "description": "Number of sample records to return (1-10)"}
-                ],
-                "example": "/api/fixed-sample?count=3"
-            },
-            {
-                "path": "/api/fixed-by-department/{department}",
-                "name": "Fixed Users by Department",
-                "description": "Returns fixed users filtered by department. Available departments: Engineering, Data Science, DevOps, Mobile, Management, Design, Data Engineering, Quality Assurance, Security.",
-                "parameters": [
-                    {"name": "department", "type": "string", "default": "Engineering", "description": "Department name to filter by"}
-                ],
-                "example": "/api/fixed-by-department/Engineering"
-            },
-            {
-                "path": "/api/fixed-active-users",
-                "name": "Fixed Active Users API",
-                "description": "Returns only active users (is_active = true) from the fixed dataset. Includes statistics about active vs total users.",
-                "parameters": [],
-                "example": "/api/fixed-active-users"
-            },
-            {
-                "path": "/api/schema",
-                "name": "Schema API",
-                "description": "Returns the JSON schema for the data objects, useful for validation and understanding the data structure.",
-                "parameters": [],
-                "example": "/api/schema"
-            }
-        ]
-    }
+    return cached_json_response(request, _API_ENDPOINTS_JSON, _API_ENDPOINTS_ETAG)
+
+# The schema is static as well, so it is serialized once at import
+DATA_OBJECT_SCHEMA = {
+    "title": "DataObject Schema",
+    "description": "Schema for the JSON objects returned by the API",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer", "description": "Unique identifier"},
+        "uuid": {"type": "string", "format": "uuid", "description": "UUID string"},
+        "name": {"type": "string", "description": "User name"},
+        "email": {"type": "string", "format": "email", "description": "Email address"},
+        "age": {"type": "integer", "minimum": 0, "maximum": 150, "description": "Age in years"},
+        "height": {"type": "number", "description": "Height in centimeters"},
+        "weight": {"type": "number", "description": "Weight in kilograms"},
+        "is_active": {"type": "boolean", "description": "Active status"},
+        "balance": {"type": "number", "description": "Account balance"},
+        "birth_date": {"type": "string", "format": "date", "description": "Birth date in ISO format"},
+        "created_at": {"type": "string", "format": "date-time", "description": "Creation timestamp"},
+        "tags": {"type": "array", "items": {"type": "string"}, "description": "Array of tags"},
+        "metadata": {"type": "object", "description": "Additional metadata object"},
+        "score": {"type": ["number", "null"], "description": "Optional score value"},
+        "description": {"type": ["string", "null"], "description": "Optional description"}
+    },
+    "required": ["id", "uuid", "name", "email", "age", "height", "weight", "is_active", 
+                "balance", "birth_date", "created_at", "tags", "metadata"]
+}
+_DATA_OBJECT_SCHEMA_JSON = json_dumps(DATA_OBJECT_SCHEMA)
+_DATA_OBJECT_SCHEMA_ETAG = make_etag(_DATA_OBJECT_SCHEMA_JSON)
 
 @app.get("/api/schema")
-async def get_schema():
+async def get_schema(request: Request):
     """Get the JSON schema for the data objects."""
-    return {
-        "title": "DataObject Schema",
-        "description": "Schema for the JSON objects returned by the API",
-        "type": "object",
-        "properties": {
-            "id": {"type": "integer", "description": "Unique identifier"},
-            "uuid": {"type": "string", "format": "uuid", "description": "UUID string"},
-            "name": {"type": "string", "description": "User name"},
-            "email": {"type": "string", "format": "email", "description": "Email address"},
-            "age": {"type": "integer", "minimum": 0, "maximum": 150, "description": "Age in years"},
-            "height": {"type": "number", "description": "Height in centimeters"},
-            "weight": {"type": "number", "description": "Weight in kilograms"},
-            "is_active": {"type": "boolean", "description": "Active status"},
-            "balance": {"type": "number", "description": "Account balance"},
-            "birth_date": {"type": "string", "format": "date", "description": "Birth date in ISO format"},
-            "created_at": {"type": "string", "format": "date-time", "description": "Creation timestamp"},
-            "tags": {"type": "array", "items": {"type": "string"}, "description": "Array of tags"},
-            "metadata": {"type": "object", "description": "Additional metadata object"},
-            "score": {"type": ["number", "null"], "description": "Optional score value"},
-            "description": {"type": ["string", "null"], "description": "Optional description"}
-        },
-        "required": ["id", "uuid", "name", "email", "age", "height", "weight", "is_active", 
-                    "balance", "birth_date", "created_at", "tags", "metadata"]
-    }
+    return cached_json_response(request, _DATA_OBJECT_SCHEMA_JSON, _DATA_OBJECT_SCHEMA_ETAG)
+
+# Mounted last so the catch-all "/" mount does not shadow the API routes
+app.mount("/", PrecompressedStaticFiles(directory=STATIC_DIR, html=True), name="static")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
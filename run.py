@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """
 Simple script to run the HTTP Data Serve API server.
+
+Set DEV=1 for a single auto-reloading process; otherwise WORKERS processes
+(default: one per CPU) are started.
 """
 
+import os
+
 import uvicorn
-from main import app
 
 if __name__ == "__main__":
+    dev = bool(int(os.getenv("DEV", "0")))
+
     print("🚀 Starting HTTP Data Serve API...")
     print("📍 Server will be available at:")
     print("   - Web UI: http://localhost:8000")
@@ -15,9 +21,12 @@ if __name__ == "__main__":
     print("\n✨ Press Ctrl+C to stop the server")
     
     uvicorn.run(
-        app, 
+        "main:app",
         host="0.0.0.0", 
         port=8000, 
-        reload=True,
+        workers=1 if dev else int(os.getenv("WORKERS", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
         log_level="info"
     )
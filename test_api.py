@@ -6,6 +6,7 @@ Simple test script to verify the API endpoints work correctly.
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def test_api():
     """Test the API endpoints."""
@@ -15,10 +16,27 @@ def test_api():
     print("=" * 50)
     
     try:
+        # The probes are independent, so issue them concurrently and check
+        # the responses in order afterwards
+        paths = [
+            "/api/data?page=1&page_size=3&total_records=100",
+            "/api/schema",
+            "/api/data-with-date-formats?page=1&page_size=2&total_records=50",
+            "/api/data?page=2&page_size=5&total_records=200",
+        ]
+
+        def probe(path):
+            # requests does not document Session as thread-safe, so each
+            # concurrent probe uses its own
+            with requests.Session() as probe_session:
+                return probe_session.get(f"{base_url}{path}")
+
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            response, schema_response, date_response, page2_response = executor.map(probe, paths)
+
         # Test the main data endpoint with custom total records
         print("📊 Testing /api/data endpoint with custom total records...")
-        response = requests.get(f"{base_url}/api/data?page=1&page_size=3&total_records=100")
-        
+
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Status: {response.status_code}")
@@ -26,20 +44,20 @@ def test_api():
             print(f"✅ Items returned: {len(data['data'])}")
             print(f"✅ Current page: {data['page']}")
             print(f"✅ Total pages: {data['total_pages']}")
-            
+
             # Verify data structure
             if data['data']:
                 first_item = data['data'][0]
                 required_fields = ['id', 'uuid', 'name', 'email', 'age', 'height', 
                                  'weight', 'is_active', 'balance', 'birth_date', 
                                  'created_at', 'tags', 'metadata']
-                
+
                 missing_fields = [field for field in required_fields if field not in first_item]
                 if not missing_fields:
                     print("✅ Data structure is correct")
                 else:
                     print(f"❌ Missing fields: {missing_fields}")
-                
+
                 # Check data types
                 print("\n🔍 Data type verification:")
                 print(f"   id: {type(first_item['id']).__name__}")
@@ -57,13 +75,12 @@ def test_api():
             print(f"❌ Failed with status: {response.status_code}")
             print(f"❌ Response: {response.text}")
             return False
-            
+
         print("\n" + "=" * 50)
-        
+
         # Test the schema endpoint
         print("📋 Testing /api/schema endpoint...")
-        schema_response = requests.get(f"{base_url}/api/schema")
-        
+
         if schema_response.status_code == 200:
             schema = schema_response.json()
             print(f"✅ Status: {schema_response.status_code}")
@@ -71,25 +88,24 @@ def test_api():
             print(f"✅ Properties count: {len(schema.get('properties', {}))}")
         else:
             print(f"❌ Schema endpoint failed with status: {schema_response.status_code}")
-            
+
         print("\n" + "=" * 50)
-        
+
         # Test the date formats endpoint
         print("🗓️ Testing /api/data-with-date-formats endpoint...")
-        date_response = requests.get(f"{base_url}/api/data-with-date-formats?page=1&page_size=2&total_records=50")
-        
+
         if date_response.status_code == 200:
             date_data = date_response.json()
             print(f"✅ Status: {date_response.status_code}")
             print(f"✅ Total items: {date_data['total']}")
             print(f"✅ Items returned: {len(date_data['data'])}")
-            
+
             # Verify date formats
             if date_data['data']:
                 first_item = date_data['data'][0]
                 date_fields = ['birth_date_iso', 'birth_date_us', 'birth_date_eu', 'birth_date_long',
                              'created_at_iso', 'created_at_timestamp', 'created_at_readable']
-                
+
                 missing_date_fields = [field for field in date_fields if field not in first_item]
                 if not missing_date_fields:
                     print("✅ All date format fields present")
@@ -103,13 +119,12 @@ def test_api():
                     print(f"❌ Missing date fields: {missing_date_fields}")
         else:
             print(f"❌ Date formats endpoint failed with status: {date_response.status_code}")
-            
+
         print("\n" + "=" * 50)
-        
+
         # Test pagination
         print("📄 Testing pagination...")
-        page2_response = requests.get(f"{base_url}/api/data?page=2&page_size=5&total_records=200")
-        
+
         if page2_response.status_code == 200:
             page2_data = page2_response.json()
             print(f"✅ Page 2 status: {page2_response.status_code}")
@@ -119,10 +134,28 @@ def test_api():
             print(f"✅ Has next: {page2_data['has_next']}")
         else:
             print(f"❌ Pagination test failed with status: {page2_response.status_code}")
-            
+
+        print("\n" + "=" * 50)
+
+        # Test conditional requests: replaying the ETag must give a 304
+        print("🔁 Testing conditional request (If-None-Match)...")
+        etag = page2_response.headers.get("ETag")
+        if etag:
+            print(f"✅ ETag: {etag}")
+            print(f"✅ Cache-Control: {page2_response.headers.get('Cache-Control')}")
+            conditional_response = requests.get(
+                f"{base_url}{paths[3]}", headers={"If-None-Match": etag}
+            )
+            if conditional_response.status_code == 304:
+                print(f"✅ Status: {conditional_response.status_code} (not modified)")
+            else:
+                print(f"❌ Expected 304, got status: {conditional_response.status_code}")
+        else:
+            print("❌ Response has no ETag header")
+
         print("\n🎉 All tests completed!")
         return True
-        
+
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to the API server.")
         print("💡 Make sure the server is running: python run.py")